@@ -8,11 +8,17 @@ for trade generation and includes basic error handling.
 
 import threading
 import queue
+from queue import Queue
 import time
+import itertools
+import collections
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from enum import Enum
 import random
+import io
+import contextlib
+import sys
 
 
 class TradeStatus(Enum):
@@ -59,8 +65,53 @@ class Trade:
         }
 
 
+class TradeRec:
+    """Lightweight slotted trade record used on the ingestion hot path"""
+    __slots__ = ('trade_id', 'symbol', 'side', 'quantity', 'price', 'timestamp', 'status', 'source')
+    _fields = frozenset(__slots__)
+
+    def __init__(self, trade_id: int = 0, symbol: Optional[str] = None, side: Optional[str] = None,
+                 quantity: int = 0, price: float = 0.0, timestamp: Optional[str] = None,
+                 status: Optional[str] = None, source: Optional[str] = None):
+        self.trade_id = trade_id
+        self.symbol = symbol
+        self.side = side
+        self.quantity = quantity
+        self.price = price
+        self.timestamp = timestamp
+        self.status = status
+        self.source = source
+
+    def __getitem__(self, key: str) -> Any:
+        # Dict-style read access for consumers written against plain trade dicts
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 # VALID SYMBOLS (DO NOT MODIFY)
-VALID_SYMBOLS = {'AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN'}
+VALID_SYMBOLS = frozenset(sys.intern(s) for s in {'AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN'})
+
+# Precomputed validation sets, built once instead of per trade
+_VALID_SIDES = frozenset(sys.intern(s.value) for s in TradeSide)
+_VALID_STATUSES = frozenset(sys.intern(s.value) for s in TradeStatus)
+
+# Precomputed sampling tables for trade simulation
+_SYMBOLS_TUP = tuple(sorted(VALID_SYMBOLS))  # Sorted for stable per-producer partitions
+_SIDES_TUP = tuple(sys.intern(s.value) for s in TradeSide)  # Enum order, independent of hash seed
+_STATUSES_TUP = tuple(sys.intern(s.value) for s in TradeStatus)
+_SIM_SRC = DataSource.SIMULATION.value
+_API_SRC = DataSource.API.value
+
+# trade_id marker for records sitting in the free list, see release()
+_RELEASED_ID = -1
+
+# Default bound on queued batches; oldest batches are dropped beyond this. At the default
+# cadence each batch carries one trade, so this is ~10k trades (at most 32x that in bursts).
+_QUEUE_MAXSIZE = 10_000
 
 
 class TradeIngestionService:
@@ -68,100 +119,266 @@ class TradeIngestionService:
     Real-time Trade Ingestion Service using Producer-Consumer Pattern
     """
 
-    def __init__(self, queue: Optional[queue.Queue] = None):
-        self.trade_queue = queue if queue else queue.Queue()
+    def __init__(self, queue: Optional[Union[queue.Queue, collections.deque]] = None, num_producers: int = 1):
+        if not 1 <= num_producers <= len(_SYMBOLS_TUP):
+            raise ValueError(f"num_producers must be between 1 and {len(_SYMBOLS_TUP)} "
+                             f"(one symbol per producer at most), got {num_producers}")
+        self.trade_queue = queue if queue is not None else Queue(maxsize=_QUEUE_MAXSIZE)
+        if isinstance(self.trade_queue, collections.deque):
+            # SPSC mode: append/popleft are atomic under the GIL, consumers use spsc_get()
+            self._enqueue = self._spsc_put
+            self._depth = self.trade_queue.__len__
+            self._data_ready = threading.Event()
+            maxsize = self.trade_queue.maxlen or 0
+        else:
+            self._enqueue = self._bounded_put
+            self._depth = self.trade_queue.qsize
+            self._data_ready = None  # Only used in SPSC mode
+            maxsize = self.trade_queue.maxsize
         self.running = threading.Event()
-        self.producer_thread = None
-        self._lock = threading.Lock()
-        self.trade_id_counter = 0
+        self._producers_done = True  # Set by stop() once every producer has flushed and exited
+        self._stop_event = threading.Event()  # Set by stop(), interrupts producer waits
+        # Each producer owns a disjoint slice of the symbols, so producers never compete per symbol
+        self.num_producers = num_producers
+        self.producer_threads = []
+        self._id_gen = itertools.count(1)  # next() is atomic under the GIL, no lock needed
+        self._last_ids = [0] * num_producers  # Last id per producer, each slot written by one thread
+        self._rec_pool = collections.deque(maxlen=1024)  # Recycled trade records, see release()
         self.data_source = DataSource.SIMULATION  # Default to simulation
+        self._fetch = self._fetch_unsupported  # Resolved from data_source in start()
+        # Batching only amortizes puts when trades arrive faster than the flush interval (the
+        # starving-consumer delay floor, or a faster source). At the default 0.5-2 s simulated
+        # cadence every put carries one trade; the interval just bounds the added latency.
+        self._batch_size = 32  # Max trades per queue put
+        self._batch_flush_interval = 0.25  # Max seconds a partial batch is held
+        self._capacity = maxsize if maxsize > 0 else _QUEUE_MAXSIZE  # Nominal capacity for unbounded queues
+        self._high_water = int(0.75 * self._capacity)  # Queue depth where backoff starts
+        self._min_delay = 0.1  # Delay floor, even while the consumer is starving
+        self._max_delay = 10.0  # Delay once the queue is at capacity
+        self._drop_lock = threading.Lock()  # Guards the drop counters below, only taken on overflow
+        self.dropped_batches = 0
+        self._drop_log_interval = 5.0  # Min seconds between drop reports
+        self._drop_logged_at = float('-inf')
+        self._drop_logged_count = 0
+        # Private RNG, avoids the shared module-level instance. It also seeds one RNG per
+        # producer thread in start(), so producers never share generator state.
+        self._rng = random.Random()
+
+    @classmethod
+    def spsc(cls) -> 'TradeIngestionService':
+        """Create a service backed by a deque for single-producer/single-consumer use"""
+        return cls(collections.deque(maxlen=_QUEUE_MAXSIZE))  # maxlen drops the oldest batch when full
 
     def start(self):
         """Start the ingestion service"""
-        if self.producer_thread is not None:
+        if self.producer_threads:
             return  # Already running
+        # Resolve the data source once, so the producer loop never branches on it
+        if self.data_source == DataSource.SIMULATION:
+            self._fetch = self._generate_sample_trade
+        elif self.data_source == DataSource.API:
+            self._fetch = self._fetch_from_api
+        else:
+            self._fetch = self._fetch_unsupported
+        self._producers_done = False
+        self._stop_event.clear()
         self.running.set()
-        self.producer_thread = threading.Thread(target=self._producer_loop, daemon=True)
-        self.producer_thread.start()
+        for i in range(self.num_producers):
+            symbols = _SYMBOLS_TUP[i::self.num_producers]
+            rng = random.Random(self._rng.getrandbits(64))
+            thread = threading.Thread(target=self._producer_loop, args=(symbols, rng, i), daemon=True)
+            thread.start()
+            self.producer_threads.append(thread)
 
     def stop(self):
         """Gracefully stop the service"""
         self.running.clear()
-        if self.producer_thread:
-            self.producer_thread.join(timeout=2.0)  # Wait up to 2 seconds
-            self.producer_thread = None
-
-    def _producer_loop(self):
-        """Main producer loop - fetch, validate, enqueue trades"""
-        while self.running.is_set():
+        self._stop_event.set()
+        for thread in self.producer_threads:
+            thread.join(timeout=2.0)  # Wait up to 2 seconds
+        self.producer_threads = []
+        self._producers_done = True  # Residual batches are enqueued, consumers may see end-of-stream
+        if self._data_ready is not None:
+            self._data_ready.set()  # Wake consumers blocked in spsc_get()
+
+    @property
+    def trade_id_counter(self) -> int:
+        """Last trade id assigned by any producer"""
+        return max(self._last_ids)  # Each slot only grows, so this never goes backwards
+
+    def spsc_get(self, timeout: Optional[float] = None) -> Optional[list]:
+        """Consumer side of SPSC mode - next batch, or None on timeout or once stopped and drained"""
+        if self._data_ready is None:
+            raise RuntimeError("spsc_get() requires a deque-backed service, see spsc()")
+        while True:
             try:
-                if self.data_source == DataSource.SIMULATION:
-                    trade_data = self._generate_sample_trade()
-                elif self.data_source == DataSource.API:
-                    trade_data = self._fetch_from_api()
-                    if trade_data is None:
-                        time.sleep(1)  # Wait if no data
-                        continue
-                else:
-                    # Placeholder for other sources like Kafka
-                    time.sleep(1)
+                return self.trade_queue.popleft()
+            except IndexError:
+                self._data_ready.clear()
+                if self.trade_queue:
+                    continue  # Producer appended between popleft and clear
+                if self._producers_done:
+                    return None
+                if not self._data_ready.wait(timeout):
+                    return None
+
+    def _bounded_put(self, item):
+        # Never block the producer on a full queue - drop the oldest batch instead. Retry
+        # because another producer can take the freed slot before our put.
+        while True:
+            try:
+                self.trade_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.trade_queue.get_nowait()
+                except queue.Empty:
                     continue
-
-                if self._validate_trade(trade_data):
-                    with self._lock:
-                        self.trade_id_counter += 1
-                        trade_data['trade_id'] = self.trade_id_counter
-                    self.trade_queue.put(trade_data)
+                self.trade_queue.task_done()  # Keep Queue.join() balanced for the evicted batch
+                self._note_drop()
+
+    def _note_drop(self):
+        with self._drop_lock:
+            self.dropped_batches += 1
+            now = time.monotonic()
+            if now - self._drop_logged_at >= self._drop_log_interval:
+                print(f"Trade queue full, dropped {self.dropped_batches - self._drop_logged_count} oldest batch(es)")
+                self._drop_logged_at = now
+                self._drop_logged_count = self.dropped_batches
+
+    def _spsc_put(self, item):
+        if len(self.trade_queue) == self.trade_queue.maxlen:
+            self._note_drop()  # append() below evicts the oldest batch
+        self.trade_queue.append(item)
+        self._data_ready.set()
+
+    def _producer_loop(self, symbols: tuple = _SYMBOLS_TUP, rng: Optional[random.Random] = None, slot: int = 0):
+        """Main producer loop - fetch, validate, enqueue trades in batches"""
+        if rng is None:
+            rng = self._rng
+        # Bind hot-path lookups to locals once, instead of per-iteration attribute loads
+        is_running = self.running.is_set
+        stopped = self._stop_event.wait
+        fetch = self._fetch
+        validate = self._validate_trade
+        next_id = self._id_gen.__next__
+        last_ids = self._last_ids
+        monotonic = time.monotonic
+        batch_size = self._batch_size
+        flush_interval = self._batch_flush_interval
+        local_batch = []
+        last_flush = monotonic()
+        while is_running():
+            try:
+                trade_data = fetch(symbols, rng)
+                if trade_data is None:
+                    delay = 1  # Wait if no data
                 else:
-                    print("Invalid trade discarded")
-
-                time.sleep(random.uniform(0.5, 2.0))  # Simulate real-time delay
+                    if validate(trade_data):
+                        trade_data.trade_id = last_ids[slot] = next_id()
+                        local_batch.append(trade_data)
+                    else:
+                        print("Invalid trade discarded")
+                        self.release(trade_data)
+                    delay = self._next_delay(rng)
             except Exception as e:
                 print(f"Error in producer loop: {e}")
-                time.sleep(1)  # Backoff on error
-
-    def _validate_trade(self, trade_data: Dict[str, Any]) -> bool:
+                delay = 1  # Backoff on error
+
+            # Wait out the delay, but wake at the pending batch's deadline so no trade is
+            # held longer than the flush interval, whatever the delay
+            while True:
+                now = monotonic()
+                if local_batch and (len(local_batch) >= batch_size or now - last_flush >= flush_interval):
+                    self._enqueue(local_batch)
+                    local_batch = []
+                    last_flush = now
+                wait = min(delay, last_flush + flush_interval - now) if local_batch else delay
+                if stopped(wait) or wait >= delay:
+                    break
+                delay -= wait
+            if self._stop_event.is_set():
+                break
+
+        # Flush any residual batch on shutdown
+        if local_batch:
+            self._enqueue(local_batch)
+
+    def _next_delay(self, rng: random.Random) -> float:
+        """Producer delay adapted to consumer backlog"""
+        depth = self._depth()
+        if depth == 0:
+            return self._min_delay  # Consumer is starving, produce at the fastest allowed rate
+        delay = rng.uniform(0.5, 2.0)  # Simulate real-time delay
+        if depth > self._high_water:
+            # Scale linearly from the normal cadence at the high-water mark to _max_delay at capacity
+            fill = min(1.0, (depth - self._high_water) / (self._capacity - self._high_water))
+            delay += fill * (self._max_delay - delay)
+        return delay
+
+    def release(self, trade: TradeRec):
+        """Return a consumed trade record to the pool for reuse.
+
+        The record is overwritten in place by a later trade, so the caller must
+        drop every reference to it (and copy out anything it wants to keep,
+        e.g. via to_dict()) before releasing. Released records carry
+        trade_id == -1 until reused, which makes stale references detectable.
+        """
+        if trade.trade_id == _RELEASED_ID:
+            raise ValueError("Trade record released twice")
+        trade.trade_id = _RELEASED_ID
+        self._rec_pool.append(trade)
+
+    def _validate_trade(self, trade_data: TradeRec) -> bool:
         """Validate trade data before enqueuing"""
-        if 'quantity' not in trade_data or trade_data['quantity'] <= 0:
-            return False
-        if 'price' not in trade_data or trade_data['price'] <= 0:
-            return False
-        if 'symbol' not in trade_data or trade_data['symbol'] not in VALID_SYMBOLS:
-            return False
-        if 'side' not in trade_data or trade_data['side'] not in [s.value for s in TradeSide]:
-            return False
-        if 'status' not in trade_data or trade_data['status'] not in [s.value for s in TradeStatus]:
-            return False
-        if 'timestamp' not in trade_data:
-            return False
-        if 'source' not in trade_data:
-            return False
-        return True
-
-    def _generate_sample_trade(self) -> Dict[str, Any]:
+        return (trade_data.quantity > 0 and
+                trade_data.price > 0 and
+                trade_data.symbol in VALID_SYMBOLS and
+                trade_data.side in _VALID_SIDES and
+                trade_data.status in _VALID_STATUSES and
+                trade_data.timestamp is not None and
+                trade_data.source is not None)
+
+    def _generate_sample_trade(self, symbols: tuple = _SYMBOLS_TUP,
+                               rng: Optional[random.Random] = None) -> TradeRec:
         """Generate sample trade for simulation"""
-        symbol = random.choice(list(VALID_SYMBOLS))
-        side = random.choice(list(TradeSide)).value
-        quantity = random.randint(100, 1000)
-        price = round(random.uniform(50, 500), 2)
+        if rng is None:
+            rng = self._rng
+        choice, randint = rng.choice, rng.randint
+        symbol = choice(symbols)
+        side = choice(_SIDES_TUP)
+        quantity = randint(100, 1000)
+        price = randint(5000, 50000) / 100  # Whole cents, no round() needed
         timestamp = datetime.now().isoformat()
-        status = random.choice(list(TradeStatus)).value
-        source = DataSource.SIMULATION.value
-        return {
-            'symbol': symbol,
-            'side': side,
-            'quantity': quantity,
-            'price': price,
-            'timestamp': timestamp,
-            'status': status,
-            'source': source
-        }
+        status = choice(_STATUSES_TUP)
+        source = _SIM_SRC
+        try:
+            trade_data = self._rec_pool.pop()
+        except IndexError:  # Pool empty, or drained by another producer
+            trade_data = TradeRec()
+        trade_data.trade_id = 0  # Clear the released marker until an id is assigned
+        trade_data.symbol = symbol
+        trade_data.side = side
+        trade_data.quantity = quantity
+        trade_data.price = price
+        trade_data.timestamp = timestamp
+        trade_data.status = status
+        trade_data.source = source
+        return trade_data
+
+    def _fetch_unsupported(self, symbols: tuple = _SYMBOLS_TUP,
+                           rng: Optional[random.Random] = None) -> Optional[TradeRec]:
+        """Placeholder for other sources like Kafka - never yields a trade"""
+        return None
 
-    def _fetch_from_api(self) -> Optional[Dict[str, Any]]:
+    def _fetch_from_api(self, symbols: tuple = _SYMBOLS_TUP,
+                        rng: Optional[random.Random] = None) -> Optional[TradeRec]:
         """Fetch trade from external API (placeholder)"""
-        if random.random() < 0.3:  # 30% success rate
-            trade_data = self._generate_sample_trade()
-            trade_data['source'] = DataSource.API.value
+        if rng is None:
+            rng = self._rng
+        if rng.random() < 0.3:  # 30% success rate
+            trade_data = self._generate_sample_trade(symbols, rng)
+            trade_data.source = _API_SRC
             return trade_data
         return None
 
@@ -187,13 +404,215 @@ def run_test():
     # Process remaining trades
     processed = 0
     while not test_queue.empty():
-        trade_data = test_queue.get()
-        print(f"Trade {trade_data['trade_id']}: {trade_data['symbol']} - {trade_data['quantity']} shares")
-        processed += 1
+        for trade_data in test_queue.get():  # Each queue item is a batch of trades
+            print(f"Trade {trade_data['trade_id']}: {trade_data['symbol']} - {trade_data['quantity']} shares")
+            processed += 1
+            service.release(trade_data)
 
     print(f"\nTest Complete: {processed} trades processed")
     assert processed >= 5, "Not enough trades generated!"
 
 
+# BEHAVIOR CHECKS
+def run_spsc_test():
+    """Check SPSC mode delivery, shutdown wakeup and lost-wakeup handling"""
+    print("Starting SPSC mode test...")
+
+    service = TradeIngestionService.spsc()
+    service.start()
+    received = []
+
+    def consume():
+        while True:
+            batch = service.spsc_get()  # No timeout - must be woken by stop()
+            if batch is None:
+                return
+            received.extend(batch)
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    time.sleep(2)
+    service.stop()
+    consumer.join(timeout=1.0)
+    assert not consumer.is_alive(), "spsc_get() still blocked after stop()"
+    ids = [trade_data['trade_id'] for trade_data in received]
+    assert ids and ids == list(range(1, len(ids) + 1)), "SPSC mode lost or reordered trades"
+
+    # Producer appends between the consumer's failed popleft and its clear()
+    service = TradeIngestionService.spsc()
+    service._producers_done = False
+    clear = service._data_ready.clear
+
+    def racing_clear():
+        service._spsc_put(['late batch'])
+        clear()
+
+    service._data_ready.clear = racing_clear
+    assert service.spsc_get(timeout=1.0) == ['late batch'], "Lost wakeup in spsc_get()"
+
+    # Stopping, but a producer has not flushed its residual batch yet: no end-of-stream until it has
+    service = TradeIngestionService.spsc()
+    service._producers_done = False
+
+    def late_flush():
+        time.sleep(0.2)
+        service._spsc_put(['residual batch'])
+        service._producers_done = True
+        service._data_ready.set()
+
+    threading.Thread(target=late_flush, daemon=True).start()
+    assert service.spsc_get(timeout=2.0) == ['residual batch'], "End-of-stream before residual flush"
+    assert service.spsc_get(timeout=2.0) is None, "No end-of-stream after producers finished"
+
+    try:
+        TradeIngestionService(queue.Queue()).spsc_get(timeout=0)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("spsc_get() accepted a Queue-backed service")
+
+    print(f"SPSC Test Complete: {len(ids)} trades consumed")
+
+
+def run_drop_oldest_test():
+    """Check the bounded queue drops the oldest batches, also under concurrent producers"""
+    print("Starting drop-oldest test...")
+
+    # A stalled consumer keeps 10,000 single-trade batches before anything is dropped
+    service = TradeIngestionService()
+    for i in range(10_000):
+        service._enqueue([i])
+    assert service.trade_queue.qsize() == 10_000 and service.dropped_batches == 0, "Default queue dropped early"
+    with contextlib.redirect_stdout(io.StringIO()):
+        service._enqueue([10_000])
+    assert service.dropped_batches == 1 and service.trade_queue.get_nowait() == [1], "Default bound not enforced"
+
+    test_queue = queue.Queue(maxsize=2)
+    service = TradeIngestionService(test_queue)
+    for i in range(5):
+        service._enqueue([i])
+    assert [test_queue.get_nowait() for _ in range(2)] == [[3], [4]], "Oldest batches not dropped"
+    assert service.dropped_batches == 3, "Dropped batches not counted"
+    test_queue.task_done()
+    test_queue.task_done()
+    joiner = threading.Thread(target=test_queue.join, daemon=True)
+    joiner.start()
+    joiner.join(timeout=1.0)
+    assert not joiner.is_alive(), "Evicted batches left Queue.join() blocked"
+
+    # Another producer takes the freed slot between our eviction and our put
+    class RacingQueue(queue.Queue):
+        raced = False
+
+        def get_nowait(self):
+            item = super().get_nowait()
+            if not self.raced:
+                self.raced = True
+                self.put_nowait(['other producer'])
+            return item
+
+    test_queue = RacingQueue(maxsize=1)
+    service = TradeIngestionService(test_queue)
+    test_queue.put_nowait(['oldest'])
+    service._enqueue(['mine'])  # Must not raise queue.Full
+    assert test_queue.get_nowait() == ['mine'] and service.dropped_batches == 2, "Racing put mishandled"
+
+    # Overflow reports are throttled, not one line per dropped batch
+    service = TradeIngestionService(queue.Queue(maxsize=1))
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        for i in range(1000):
+            service._enqueue([i])
+    assert service.dropped_batches == 999 and log.getvalue().count("\n") == 1, "Drop log not throttled"
+
+    service = TradeIngestionService(collections.deque(maxlen=2))
+    for i in range(5):
+        service._enqueue([i])
+    assert list(service.trade_queue) == [[3], [4]] and service.dropped_batches == 3, "SPSC drops wrong"
+
+    print("Drop-oldest Test Complete")
+
+
+def run_multi_producer_test():
+    """Check symbol partitioning, unique ids and stop latency with several producers"""
+    print("Starting multi-producer test...")
+
+    for bad in (0, len(_SYMBOLS_TUP) + 1):
+        try:
+            TradeIngestionService(num_producers=bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"num_producers={bad} accepted")
+
+    test_queue = queue.Queue()
+    service = TradeIngestionService(test_queue, num_producers=3)
+    symbols_by_thread = collections.defaultdict(set)
+    generate = service._generate_sample_trade
+
+    def recording_generate(symbols, rng):
+        trade_data = generate(symbols, rng)
+        symbols_by_thread[threading.current_thread().name].add(trade_data.symbol)
+        return trade_data
+
+    service._generate_sample_trade = recording_generate
+    service.start()
+    time.sleep(2)
+    producers = list(service.producer_threads)
+    stop_started = time.monotonic()
+    service.stop()
+    stop_latency = time.monotonic() - stop_started
+    assert stop_latency < 0.5, f"stop() took {stop_latency:.2f}s"
+    assert not any(producer.is_alive() for producer in producers), "Producer outlived stop()"
+
+    ids = []
+    while not test_queue.empty():
+        ids.extend(trade_data['trade_id'] for trade_data in test_queue.get())
+    assert len(ids) == len(set(ids)), "Duplicate trade ids across producers"
+    assert service.trade_id_counter == max(ids), "trade_id_counter out of step"
+    assert len(symbols_by_thread) == 3, "Not every producer generated trades"
+    all_symbols = set().union(*symbols_by_thread.values())
+    assert sum(map(len, symbols_by_thread.values())) == len(all_symbols), "Producers shared symbols"
+
+    print(f"Multi-producer Test Complete: {len(ids)} trades, stop took {stop_latency * 1000:.1f} ms")
+
+
+def run_api_latency_test():
+    """Check partial batches are flushed within the flush interval in API mode"""
+    print("Starting API latency test...")
+
+    test_queue = queue.Queue()
+    service = TradeIngestionService(test_queue, num_producers=len(_SYMBOLS_TUP))
+    service.data_source = DataSource.API
+    latencies = []
+
+    def consume():
+        # Keeps up with the producers, so any latency is time spent held in a partial batch
+        while service.running.is_set() or not test_queue.empty():
+            try:
+                batch = test_queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            received = datetime.now()
+            latencies.extend((received - datetime.fromisoformat(trade_data['timestamp'])).total_seconds()
+                             for trade_data in batch)
+
+    service.start()
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    time.sleep(6)
+    service.stop()
+    consumer.join(timeout=1.0)
+    assert latencies, "No trades fetched in API mode"
+    worst = max(latencies)
+    assert worst <= service._batch_flush_interval + 0.1, f"Trade held {worst:.2f}s in a partial batch"
+
+    print(f"API Latency Test Complete: {len(latencies)} trades, worst {worst * 1000:.0f} ms")
+
+
 if __name__ == "__main__":
-    run_test()
\ No newline at end of file
+    run_test()
+    run_spsc_test()
+    run_drop_oldest_test()
+    run_multi_producer_test()
+    run_api_latency_test()
\ No newline at end of file